@@ -0,0 +1,66 @@
+"""
+Shared helpers for the MCP client scripts.
+"""
+import asyncio
+from mcp import ClientSession
+from mcp.client.streamable_http import streamablehttp_client
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+def run(coro):
+    """
+    Run a coroutine with asyncio.run, on the faster uvloop event loop when
+    it is installed.
+    """
+    if uvloop is not None:
+        return asyncio.run(coro, loop_factory=uvloop.new_event_loop)
+    return asyncio.run(coro)
+
+
+async def _list_all(server_url: str, kinds: list[str]) -> dict:
+    """
+    Open a single session and list the given kinds concurrently.
+    Kinds are "tools", "resources" and "resource_templates".
+    """
+    async with streamablehttp_client(server_url) as (read, write, get_session_id):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            
+            results = await asyncio.gather(
+                *[getattr(session, f"list_{kind}")() for kind in kinds]
+            )
+    
+    return dict(zip(kinds, results))
+
+
+def print_tools(tools):
+    """Print the result of a list_tools call."""
+    print(f"\n🔧 Found {len(tools.tools)} tool(s):\n")
+    for tool in tools.tools:
+        print(f"• {tool.name}")
+        if tool.description:
+            print(f"  {tool.description}")
+
+
+def print_resources(resources):
+    """Print the result of a list_resources call."""
+    print(f"\n📦 Found {len(resources.resources)} direct resource(s):\n")
+    for resource in resources.resources:
+        print(f"• {resource.name}")
+        print(f"  URI: {resource.uri}")
+        if resource.description:
+            print(f"  {resource.description}")
+
+
+def print_resource_templates(templates):
+    """Print the result of a list_resource_templates call."""
+    print(f"\n📋 Found {len(templates.resourceTemplates)} resource template(s):\n")
+    for template in templates.resourceTemplates:
+        print(f"• {template.name}")
+        print(f"  URI Template: {template.uriTemplate}")
+        if template.description:
+            print(f"  {template.description}")
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Simple script to list MCP tools, resources and resource templates from a server
+using a single connection.
+Usage: python list_all.py [server_url]
+"""
+import sys
+from _common import _list_all, run, print_tools, print_resources, print_resource_templates
+
+
+async def list_all(server_url: str = "http://localhost:8000/mcp"):
+    """List all tools, resources and resource templates from an MCP server."""
+    print(f"Connecting to: {server_url}")
+    
+    results = await _list_all(server_url, ["tools", "resources", "resource_templates"])
+    
+    print_tools(results["tools"])
+    print_resources(results["resources"])
+    print_resource_templates(results["resource_templates"])
+
+
+if __name__ == "__main__":
+    server_url = sys.argv[1] if len(sys.argv) > 1 else "http://localhost:8000/mcp"
+    
+    try:
+        run(list_all(server_url))
+    except Exception as e:
+        print(f"Error: {e}")
+        print("\nMake sure the server is running:")
+        print("  cd solutions/server && uv run main.py")
+        sys.exit(1)
+
@@ -5,14 +5,115 @@ MCP Client that connects to the MCP server and allows interactive tool execution
 import asyncio
 import json
 import re
+import sys
+import threading
 from typing import Any, Dict
 from mcp import ClientSession
 from mcp.client.streamable_http import streamablehttp_client
+from _common import run
 
+# Matches the {param} placeholders in a resource URI template
+_PARAM_RE = re.compile(r'{(\w+)}')
 
-def build_arguments_from_schema(input_schema: Dict[str, Any]) -> Dict[str, Any]:
+# Converts user input to the JSON schema type of a tool parameter,
+# any type not listed here is passed through as a string
+_CONVERTERS = {
+    "integer": int,
+    "number": float,
+    "boolean": lambda s: s.lower() in ("true", "yes", "1", "y"),
+    "object": json.loads,
+    "array": json.loads,
+}
+
+
+async def _ainput(prompt: str = "") -> str:
+    """
+    Read a line from stdin without blocking the event loop.
+    The line is read from the unbuffered stdin stream in a daemon thread,
+    rather than with input() in asyncio.to_thread, so Ctrl+C does not have
+    to wait for a pending read to finish before the program can exit.
+    The raw stream has no buffer lock to hold at shutdown, and on Windows
+    it reads the console as UTF-8.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def resolve(result, error):
+        # The prompt may have been cancelled while waiting for input
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    
+    def read():
+        # Read one byte at a time so nothing after the newline is consumed
+        data = bytearray()
+        try:
+            while not data.endswith(b"\n"):
+                chunk = sys.stdin.buffer.raw.read(1)
+                if not chunk:
+                    break
+                data += chunk
+            if data:
+                # Undecodable bytes are replaced rather than raising, so they
+                # are not reported as an invalid menu choice
+                text = data.decode(sys.stdin.encoding or "utf-8", errors="replace")
+                result, error = text.rstrip("\r\n"), None
+            else:
+                result, error = None, EOFError()
+        except Exception as e:
+            result, error = None, e
+        try:
+            loop.call_soon_threadsafe(resolve, result, error)
+        except RuntimeError:
+            # The event loop is already closed
+            pass
+    
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    
+    threading.Thread(target=read, daemon=True).start()
+    return await future
+
+
+def _print_parameters_header():
+    """Print the header shown before prompting for parameter values."""
+    print("\n📝 Please provide the following parameters:")
+    print("-" * 60)
+
+
+async def _read_and_print(session: ClientSession, uri: str):
+    """Read a resource from the server and print its contents."""
+    result = await session.read_resource(uri)
+    
+    # Display results
+    print("\n✨ Resource Contents:")
+    print("-" * 60)
+    
+    if result.contents:
+        for item in result.contents:
+            text = getattr(item, 'text', None)
+            if text is not None:
+                print(text)
+                continue
+            
+            blob = getattr(item, 'blob', None)
+            if blob is not None:
+                print(f"[Binary data: {len(blob)} bytes]")
+            else:
+                print(item)
+    else:
+        print("(No content returned)")
+    
+    print("-" * 60)
+
+
+async def build_arguments_from_schema(input_schema: Dict[str, Any]) -> Dict[str, Any]:
     """
     Prompt the user to build arguments based on the tool's input schema.
+    Input is read with _ainput so the event loop keeps serving the session.
     """
     arguments = {}
     
@@ -22,8 +123,7 @@ def build_arguments_from_schema(input_schema: Dict[str, Any]) -> Dict[str, Any]:
     properties = input_schema.get("properties", {})
     required = input_schema.get("required", [])
     
-    print("\n📝 Please provide the following parameters:")
-    print("-" * 60)
+    _print_parameters_header()
     
     for param_name, param_info in properties.items():
         param_type = param_info.get("type", "string")
@@ -37,9 +137,12 @@ def build_arguments_from_schema(input_schema: Dict[str, Any]) -> Dict[str, Any]:
             print(f"  Description: {param_desc}")
         print(f"  Type: {param_type}")
         
+        # Type arrays such as ["string", "null"] are not looked up and use str
+        convert = _CONVERTERS.get(param_type, str) if isinstance(param_type, str) else str
+        
         # Get user input
         while True:
-            user_input = input(f"  Enter value: ").strip()
+            user_input = (await _ainput("  Enter value: ")).strip()
             
             # Allow skipping optional parameters
             if not user_input and not is_required:
@@ -52,16 +155,7 @@ def build_arguments_from_schema(input_schema: Dict[str, Any]) -> Dict[str, Any]:
             
             # Type conversion
             try:
-                if param_type == "integer":
-                    arguments[param_name] = int(user_input)
-                elif param_type == "number":
-                    arguments[param_name] = float(user_input)
-                elif param_type == "boolean":
-                    arguments[param_name] = user_input.lower() in ("true", "yes", "1", "y")
-                elif param_type == "object" or param_type == "array":
-                    arguments[param_name] = json.loads(user_input)
-                else:
-                    arguments[param_name] = user_input
+                arguments[param_name] = convert(user_input)
                 break
             except (ValueError, json.JSONDecodeError) as e:
                 print(f"  ⚠️  Invalid input for type {param_type}: {e}")
@@ -70,6 +164,20 @@ def build_arguments_from_schema(input_schema: Dict[str, Any]) -> Dict[str, Any]:
     return arguments
 
 
+async def list_server_items(session: ClientSession):
+    """
+    List the tools, resources and resource templates available on the server.
+    The three requests are sent concurrently over the same session.
+    """
+    tools_result, resources_result, templates_result = await asyncio.gather(
+        session.list_tools(),
+        session.list_resources(),
+        session.list_resource_templates(),
+    )
+    
+    return tools_result.tools, resources_result.resources, templates_result.resourceTemplates
+
+
 async def interactive_tool_client():
     """
     Interactive MCP client that allows users to select and execute tools.
@@ -92,71 +200,70 @@ async def interactive_tool_client():
                 else:
                     print("📋 Server connected\n")
                 
+                # List available tools, resources, and resource templates once,
+                # they are only fetched again when the user asks for a refresh
+                tools, resources, templates = await list_server_items(session)
+                
                 # Main interactive loop
                 while True:
-                    # List available tools, resources, and resource templates
-                    tools_result = await session.list_tools()
-                    tools = tools_result.tools
-                    
-                    resources_result = await session.list_resources()
-                    resources = resources_result.resources
-                    
-                    templates_result = await session.list_resource_templates()
-                    templates = templates_result.resourceTemplates
-                    
                     if not tools and not resources and not templates:
                         print("❌ No tools or resources available on the server.")
                         break
                     
-                    print("\n" + "=" * 60)
-                    print("🔧 Available Tools:")
-                    print("=" * 60)
+                    # Build the menu and write it to stdout in one go
+                    lines = ["", "=" * 60, "🔧 Available Tools:", "=" * 60]
                     
                     if tools:
                         for i, tool in enumerate(tools, 1):
-                            print(f"\n{i}. {tool.name}")
-                            print(f"   {tool.description}")
+                            lines.append(f"\n{i}. {tool.name}")
+                            lines.append(f"   {tool.description}")
                     else:
-                        print("\n(No tools available)")
+                        lines.append("\n(No tools available)")
                     
-                    print("\n" + "=" * 60)
-                    print("📦 Available Resources:")
-                    print("=" * 60)
+                    lines += ["", "=" * 60, "📦 Available Resources:", "=" * 60]
                     
                     if resources:
                         for i, resource in enumerate(resources, len(tools) + 1):
-                            print(f"\n{i}. {resource.name}")
-                            print(f"   URI: {resource.uri}")
+                            lines.append(f"\n{i}. {resource.name}")
+                            lines.append(f"   URI: {resource.uri}")
                             if resource.description:
-                                print(f"   {resource.description}")
+                                lines.append(f"   {resource.description}")
                     else:
-                        print("\n(No direct resources available)")
+                        lines.append("\n(No direct resources available)")
                     
-                    print("\n" + "=" * 60)
-                    print("📋 Available Resource Templates:")
-                    print("=" * 60)
+                    lines += ["", "=" * 60, "📋 Available Resource Templates:", "=" * 60]
                     
                     if templates:
                         for i, template in enumerate(templates, len(tools) + len(resources) + 1):
-                            print(f"\n{i}. {template.name}")
-                            print(f"   URI Template: {template.uriTemplate}")
+                            lines.append(f"\n{i}. {template.name}")
+                            lines.append(f"   URI Template: {template.uriTemplate}")
                             if template.description:
-                                print(f"   {template.description}")
+                                lines.append(f"   {template.description}")
                     else:
-                        print("\n(No resource templates available)")
+                        lines.append("\n(No resource templates available)")
+                    
+                    lines += ["\nr. Refresh", "0. Exit", "=" * 60]
                     
-                    print(f"\n0. Exit")
-                    print("=" * 60)
+                    sys.stdout.write("\n".join(lines) + "\n")
+                    sys.stdout.flush()
                     
                     # Get user choice
                     try:
-                        choice = input("\nSelect a tool, resource, or template (enter number): ").strip()
+                        choice = (await _ainput("\nSelect a tool, resource, or template (enter number, or 'r' to refresh): ")).strip()
                         
                         if choice == "0" or choice == "":
                             print("\n👋 Goodbye!")
                             break
                         
-                        selection_index = int(choice) - 1
+                        if choice.lower() == "r":
+                            tools, resources, templates = await list_server_items(session)
+                            continue
+                        
+                        try:
+                            selection_index = int(choice) - 1
+                        except ValueError:
+                            print("❌ Invalid input. Please enter a number.")
+                            continue
                         total_items = len(tools) + len(resources) + len(templates)
                         
                         if selection_index < 0 or selection_index >= total_items:
@@ -173,7 +280,7 @@ async def interactive_tool_client():
                             
                             # Build arguments from input schema
                             input_schema = selected_tool.inputSchema
-                            arguments = build_arguments_from_schema(input_schema)
+                            arguments = await build_arguments_from_schema(input_schema)
                             
                             print(f"\n⚙️  Calling {selected_tool.name} with arguments:")
                             print(f"{json.dumps(arguments, indent=2)}")
@@ -188,10 +295,8 @@ async def interactive_tool_client():
                             
                             if result.content:
                                 for item in result.content:
-                                    if hasattr(item, 'text'):
-                                        print(item.text)
-                                    else:
-                                        print(item)
+                                    text = getattr(item, 'text', None)
+                                    print(text if text is not None else item)
                             else:
                                 print("(No content returned)")
                             
@@ -209,25 +314,8 @@ async def interactive_tool_client():
                             print(f"URI: {selected_resource.uri}")
                             print()
                             
-                            # Read the resource
-                            result = await session.read_resource(selected_resource.uri)
-                            
-                            # Display results
-                            print("\n✨ Resource Contents:")
-                            print("-" * 60)
-                            
-                            if result.contents:
-                                for item in result.contents:
-                                    if hasattr(item, 'text'):
-                                        print(item.text)
-                                    elif hasattr(item, 'blob'):
-                                        print(f"[Binary data: {len(item.blob)} bytes]")
-                                    else:
-                                        print(item)
-                            else:
-                                print("(No content returned)")
-                            
-                            print("-" * 60)
+                            # Read the resource and display its contents
+                            await _read_and_print(session, selected_resource.uri)
                         else:
                             # It's a resource template
                             template_index = selection_index - len(tools) - len(resources)
@@ -238,14 +326,13 @@ async def interactive_tool_client():
                             print(f"URI Template: {selected_template.uriTemplate}")
                             
                             # Extract parameters from URI template
-                            params = re.findall(r'{(\w+)}', selected_template.uriTemplate)
+                            params = _PARAM_RE.findall(selected_template.uriTemplate)
                             
                             # Prompt for parameter values
                             param_values = {}
-                            print("\n📝 Please provide the following parameters:")
-                            print("-" * 60)
+                            _print_parameters_header()
                             for param in params:
-                                value = input(f"  {param}: ").strip()
+                                value = (await _ainput(f"  {param}: ")).strip()
                                 if not value:
                                     print(f"  ⚠️  Parameter '{param}' is required.")
                                     break
@@ -256,44 +343,20 @@ async def interactive_tool_client():
                                 continue
                             
                             # Construct the URI from the template
-                            uri = selected_template.uriTemplate
-                            for param, value in param_values.items():
-                                uri = uri.replace(f'{{{param}}}', value)
+                            uri = _PARAM_RE.sub(lambda m: param_values[m.group(1)], selected_template.uriTemplate)
                             
                             print(f"\nConstructed URI: {uri}")
                             print()
                             
-                            # Read the resource
-                            result = await session.read_resource(uri)
-                            
-                            # Display results
-                            print("\n✨ Resource Contents:")
-                            print("-" * 60)
-                            
-                            if result.contents:
-                                for item in result.contents:
-                                    if hasattr(item, 'text'):
-                                        print(item.text)
-                                    elif hasattr(item, 'blob'):
-                                        print(f"[Binary data: {len(item.blob)} bytes]")
-                                    else:
-                                        print(item)
-                            else:
-                                print("(No content returned)")
-                            
-                            print("-" * 60)
+                            # Read the resource and display its contents
+                            await _read_and_print(session, uri)
                         
                         # Ask if user wants to continue
-                        continue_choice = input("\nPress Enter to continue or 'q' to quit: ").strip().lower()
+                        continue_choice = (await _ainput("\nPress Enter to continue or 'q' to quit: ")).strip().lower()
                         if continue_choice == 'q':
                             print("\n👋 Goodbye!")
                             break
                         
-                    except ValueError:
-                        print("❌ Invalid input. Please enter a number.")
-                    except KeyboardInterrupt:
-                        print("\n\n👋 Goodbye!")
-                        break
                     except Exception as e:
                         print(f"\n❌ Error executing tool: {e}")
                         print("Please try again.")
@@ -313,7 +376,7 @@ def main():
     print()
     
     try:
-        asyncio.run(interactive_tool_client())
+        run(interactive_tool_client())
     except KeyboardInterrupt:
         print("\n\n👋 Goodbye!")
     
@@ -1,9 +1,14 @@
+import asyncio
+import atexit
+import logging
 import os
+import threading
+import time
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 
-# from neo4j import AsyncGraphDatabase, AsyncDriver
+from neo4j import AsyncGraphDatabase, AsyncDriver, AsyncResult
 from neo4j import GraphDatabase, Driver
 from neo4j_graphrag.llm import OpenAILLM
 from neo4j_graphrag.embeddings.openai import OpenAIEmbeddings
@@ -17,10 +22,152 @@ from mcp.server.fastmcp import FastMCP, Context
 from dotenv import load_dotenv
 load_dotenv()
 
+# Specify your own Neo4j schema
+NEO4J_SCHEMA = """
+Node properties:
+Person {name: STRING, born: INTEGER}
+Movie {tagline: STRING, title: STRING, released: INTEGER}
+Genre {name: STRING}
+User {name: STRING}
+
+Relationship properties:
+ACTED_IN {role: STRING}
+RATED {rating: INTEGER}
+
+The relationships:
+(:Person)-[:ACTED_IN]->(:Movie)
+(:Person)-[:DIRECTED]->(:Movie)
+(:User)-[:RATED]->(:Movie)
+(:Movie)-[:IN_GENRE]->(:Genre)
+"""
+
+# Cypher examples as input/query pairs
+CYPHER_EXAMPLES = [
+    "USER INPUT: 'Get user ratings for a movie?' QUERY: MATCH (u:User)-[r:RATED]->(m:Movie) WHERE m.title = 'Movie Title' RETURN r.rating",
+    "USER INPUT: 'Get details for this case sensitive name property' QUERY: MATCH (n) WHERE toLower(n.name) CONTAINS toLower(name) RETURN n",
+]
+
+# Cypher queries used by the tools, only the parameters change between calls
+_Q_STATS = "RETURN COUNT {()} AS nodes, COUNT {()-[]->()} AS relationships"
+
+_Q_SEARCH_TITLE = """
+MATCH (m:Movie)
+WHERE toLower(m.title) CONTAINS toLower($title)
+RETURN 
+    m.tmdbId AS tmdbId,
+    m.title AS title,
+    m.plot AS plot,
+    m.released AS released
+LIMIT $limit
+"""
+
+_Q_MOVIE_BY_TMDB = """
+MATCH (m:Movie {tmdbId: $tmdbId})
+RETURN m.title AS title,
+       m.released AS released,
+       m.tagline AS tagline,
+       m.runtime AS runtime,
+       m.plot AS plot,
+       [ (m)-[:IN_GENRE]->(g:Genre) | g.name ] AS genres,
+       [ (p)-[r:ACTED_IN]->(m) | {name: p.name, role: r.role} ] AS actors,
+       [ (d)-[:DIRECTED]->(m) | d.name ] AS directors
+"""
+
+# Graph statistics are cached for this many seconds, counting on a large
+# graph is expensive and the totals rarely change between calls
+STATS_CACHE_TTL = 30
+_stats_cache = {"t": 0.0, "val": None}
+
+# The OpenAI clients are created on first use and shared by every MCP session,
+# the lifespan runs once per session rather than once per server run
+_openai_cache = {"embedder": None, "t2c_llm": None}
+
+def get_embedder() -> OpenAIEmbeddings:
+    """Return the shared embedder used to search movies by plot."""
+    if _openai_cache["embedder"] is None:
+        _openai_cache["embedder"] = OpenAIEmbeddings(model="text-embedding-ada-002")
+    return _openai_cache["embedder"]
+
+def get_t2c_llm() -> OpenAILLM:
+    """Return the shared LLM used to generate Cypher."""
+    if _openai_cache["t2c_llm"] is None:
+        _openai_cache["t2c_llm"] = OpenAILLM(
+            model_name="gpt-4o",
+            model_params={"temperature": 0}
+        )
+    return _openai_cache["t2c_llm"]
+
+# The neo4j_graphrag retrievers only accept a synchronous driver. The driver
+# and the retrievers are also created on first use and shared by every session,
+# so a missing vector index only affects the tools that use them
+_retriever_cache = {"driver": None, "plot": None, "t2c": None}
+_retriever_lock = threading.Lock()
+
+def _get_retriever_driver() -> Driver:
+    """Return the synchronous driver used by the retrievers."""
+    if _retriever_cache["driver"] is None:
+        driver = GraphDatabase.driver(
+            os.getenv("NEO4J_URI"),
+            auth=(os.getenv("NEO4J_USERNAME"), os.getenv("NEO4J_PASSWORD"))
+        )
+        # Close the driver when the server exits
+        atexit.register(driver.close)
+        _retriever_cache["driver"] = driver
+    return _retriever_cache["driver"]
+
+def get_plot_retriever() -> VectorRetriever:
+    """Return the shared retriever used to search movies by plot."""
+    # The lock stops concurrent first calls from building it twice
+    with _retriever_lock:
+        if _retriever_cache["plot"] is None:
+            _retriever_cache["plot"] = VectorRetriever(
+                _get_retriever_driver(),
+                neo4j_database=os.getenv("NEO4J_DATABASE"),
+                index_name="moviePlots",
+                embedder=get_embedder(),
+                return_properties=["title", "tmdbId", "plot"],
+            )
+        return _retriever_cache["plot"]
+
+def get_t2c_retriever() -> Text2CypherRetriever:
+    """Return the shared retriever used to answer questions with Cypher."""
+    with _retriever_lock:
+        if _retriever_cache["t2c"] is None:
+            _retriever_cache["t2c"] = Text2CypherRetriever(
+                driver=_get_retriever_driver(),
+                neo4j_database=os.getenv("NEO4J_DATABASE"),
+                llm=get_t2c_llm(),
+                neo4j_schema=NEO4J_SCHEMA,
+                examples=CYPHER_EXAMPLES,
+            )
+        return _retriever_cache["t2c"]
+
+# Info notifications are only sent to the client when MCP_VERBOSE=1
+_VERBOSE = os.getenv("MCP_VERBOSE", "0") == "1"
+_background_tasks = set()
+
+logger = logging.getLogger(__name__)
+
+def _log_task_done(task: asyncio.Task) -> None:
+    """Forget a finished notification task and log it if it failed."""
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("Failed to send info notification", exc_info=task.exception())
+
+def log_info(ctx: Context, message: str) -> None:
+    """Send an info notification to the client without waiting for it."""
+    if not _VERBOSE:
+        return
+
+    # Keep a reference to the task so it is not garbage collected early
+    task = asyncio.create_task(ctx.info(message))
+    _background_tasks.add(task)
+    task.add_done_callback(_log_task_done)
+
 @dataclass
 class AppContext:
     """Application context with Neo4j driver."""
-    driver: Driver
+    driver: AsyncDriver
     database: str
 
 @asynccontextmanager
@@ -34,14 +181,14 @@ async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
     database = os.getenv("NEO4J_DATABASE")
 
     # Initialize driver on startup
-    driver = GraphDatabase.driver(uri, auth=(username, password))
+    driver = AsyncGraphDatabase.driver(uri, auth=(username, password))
 
     try:
         # Yield context with driver
         yield AppContext(driver=driver, database=database)
     finally:
         # Close driver on shutdown
-        driver.close()
+        await driver.close()
 
 # Create server with lifespan
 mcp = FastMCP("Movies GraphRAG Server", lifespan=app_lifespan)
@@ -50,58 +197,61 @@ mcp = FastMCP("Movies GraphRAG Server", lifespan=app_lifespan)
 async def graph_statistics(ctx: Context) -> dict[str, int]:
     """Count the number of nodes and relationships in the graph."""
 
+    # Return the cached statistics if they are recent enough
+    if _stats_cache["val"] is not None and time.monotonic() - _stats_cache["t"] < STATS_CACHE_TTL:
+        return _stats_cache["val"]
+
     # Access the driver from lifespan context
     driver = ctx.request_context.lifespan_context.driver
     database = ctx.request_context.lifespan_context.database
 
     # Use the driver to query Neo4j with the correct database
-    records, summary, keys = driver.execute_query(
-        r"RETURN COUNT {()} AS nodes, COUNT {()-[]-()} AS relationships",
+    records, summary, keys = await driver.execute_query(
+        _Q_STATS,
         database_=database
     )
 
     # Process the results
-    if records:
-        return dict(records[0])
-    return {"nodes": 0, "relationships": 0}
+    stats = dict(records[0]) if records else {"nodes": 0, "relationships": 0}
+
+    _stats_cache["t"] = time.monotonic()
+    _stats_cache["val"] = stats
+
+    return stats
 
 @mcp.tool()
-async def search_movies_by_title(title: str, ctx: Context = None) -> list[dict]:
+async def search_movies_by_title(title: str, limit: int = 25, ctx: Context = None) -> list[dict]:
     """
     Search for movies by a title.
 
     Args:
         title: The title of the movie 
+        limit: The maximum number of movies to return
         ctx: Context object (injected automatically)
 
     Returns:
         List of movies with tmdbId, title, plot and release date.
     """
-    await ctx.info(f"Searching for a movie by title : {title}")
+    log_info(ctx, f"Searching for a movie by title : {title}")
 
     driver = ctx.request_context.lifespan_context.driver
     database = ctx.request_context.lifespan_context.database
 
     try:
-        records, _, _ = driver.execute_query(
-            """
-            MATCH (m:Movie)
-            WHERE toLower(m.title) CONTAINS toLower($title)
-            RETURN 
-                m.tmdbId AS tmdbId,
-                m.title AS title,
-                m.plot AS plot,
-                m.released AS released
-            """,
+        # AsyncResult.data returns the records as a list of dictionaries
+        records = await driver.execute_query(
+            _Q_SEARCH_TITLE,
             title=title,
-            database_=database
+            limit=limit,
+            database_=database,
+            result_transformer_=AsyncResult.data
         )
 
         if not records:
             await ctx.warning(f"No movies found with a title containing '{title}'")
             return f"No movies found with a title containing '{title}'"
         
-        return [record.data() for record in records]
+        return records
     
     except Exception as e:
         await ctx.error(f"Failed to find movie by title: {str(e)}")
@@ -121,24 +271,13 @@ async def search_movies_by_plot(plot: str, top_k: int = 6, ctx: Context = None)
     Returns:
         List of movies with title, tmdbId and plot ordered by similarity score.
     """
-    await ctx.info(f"Searching for a movie by plot : {plot}")
-
-    driver = ctx.request_context.lifespan_context.driver
-    database = ctx.request_context.lifespan_context.database
+    log_info(ctx, f"Searching for a movie by plot : {plot}")
 
     try:
-        embedder = OpenAIEmbeddings(model="text-embedding-ada-002")
-        
-        # Create retriever
-        retriever = VectorRetriever(
-            driver,
-            neo4j_database=database,
-            index_name="moviePlots",
-            embedder=embedder,
-            return_properties=["title", "tmdbId", "plot"],
-        )
-
-        result = retriever.search(query_text=plot, top_k=top_k)
+        # Building the retriever and searching both block, so they run in a
+        # thread to keep the event loop free
+        retriever = await asyncio.to_thread(get_plot_retriever)
+        result = await asyncio.to_thread(retriever.search, query_text=plot, top_k=top_k)
         movies = []
         for item in result.items:
             movies.append(item.content)
@@ -160,24 +299,14 @@ async def get_movie_information_by_tmdbId(tmdbId: str, ctx: Context) -> str:
     Returns:
         Formatted string with movie details including title, plot, cast, and genres
     """
-    await ctx.info(f"Fetching movie details for TMDB ID: {tmdbId}")
+    log_info(ctx, f"Fetching movie details for TMDB ID: {tmdbId}")
 
     driver = ctx.request_context.lifespan_context.driver
     database = ctx.request_context.lifespan_context.database
 
     try:
-        records, _, _ = driver.execute_query(
-            """
-            MATCH (m:Movie {tmdbId: $tmdbId})
-            RETURN m.title AS title,
-               m.released AS released,
-               m.tagline AS tagline,
-               m.runtime AS runtime,
-               m.plot AS plot,
-               [ (m)-[:IN_GENRE]->(g:Genre) | g.name ] AS genres,
-               [ (p)-[r:ACTED_IN]->(m) | {name: p.name, role: r.role} ] AS actors,
-               [ (d)-[:DIRECTED]->(m) | d.name ] AS directors
-            """,
+        records, _, _ = await driver.execute_query(
+            _Q_MOVIE_BY_TMDB,
             tmdbId=tmdbId,
             database_=database
         )
@@ -186,31 +315,36 @@ async def get_movie_information_by_tmdbId(tmdbId: str, ctx: Context) -> str:
             await ctx.warning(f"Movie with TMDB ID {tmdbId} not found")
             return f"Movie with TMDB ID {tmdbId} not found in database"
 
-        movie = records[0].data()
+        # Read the values straight from the record
+        record = records[0]
+        title = record["title"]
+        released = record["released"]
+        tagline = record["tagline"]
+        runtime = record["runtime"]
+        plot = record["plot"]
+        genres = record["genres"]
+        actors = record["actors"]
+        directors = record["directors"]
 
         # Format the output
-        output = []
-        output.append(f"# {movie['title']} ({movie['released']})")
-        output.append("")
+        output = [f"# {title} ({released})", ""]
 
-        if movie['tagline']:
-            output.append(f"_{movie['tagline']}_")
-            output.append("")
+        if tagline:
+            output.extend([f"_{tagline}_", ""])
 
-        output.append(f"**Runtime:** {movie['runtime']} minutes")
-        output.append(f"**Genres:** {', '.join(movie['genres'])}")
+        output.extend([
+            f"**Runtime:** {runtime} minutes",
+            f"**Genres:** {', '.join(genres)}",
+        ])
 
-        if movie['directors']:
-            output.append(f"**Director(s):** {', '.join(movie['directors'])}")
+        if directors:
+            output.append(f"**Director(s):** {', '.join(directors)}")
 
-        output.append("")
-        output.append("## Plot")
-        output.append(movie['plot'])
+        output.extend(["", "## Plot", plot])
 
-        if movie['actors']:
-            output.append("")
-            output.append("## Cast")
-            for actor in movie['actors']:
+        if actors:
+            output.extend(["", "## Cast"])
+            for actor in actors:
                 if actor['role']:
                     output.append(f"- {actor['name']} as {actor['role']}")
                 else:
@@ -218,7 +352,9 @@ async def get_movie_information_by_tmdbId(tmdbId: str, ctx: Context) -> str:
 
         result = "\n".join(output)
 
-        await ctx.info(f"Successfully fetched details for '{movie['title']}'")
+        # Awaited so the notice is sent before the tool response
+        if _VERBOSE:
+            await ctx.info(f"Successfully fetched details for '{title}'")
 
         return result
 
@@ -239,50 +375,10 @@ async def catch_all_query_movie_database(query: str, ctx: Context) -> dict:
     """
     pass
 
-    driver = ctx.request_context.lifespan_context.driver
-    database = ctx.request_context.lifespan_context.database
-
-    # Create Cypher LLM 
-    t2c_llm = OpenAILLM(
-        model_name="gpt-4o", 
-        model_params={"temperature": 0}
-    )
-
-    # Specify your own Neo4j schema
-    neo4j_schema = """
-    Node properties:
-    Person {name: STRING, born: INTEGER}
-    Movie {tagline: STRING, title: STRING, released: INTEGER}
-    Genre {name: STRING}
-    User {name: STRING}
-
-    Relationship properties:
-    ACTED_IN {role: STRING}
-    RATED {rating: INTEGER}
-
-    The relationships:
-    (:Person)-[:ACTED_IN]->(:Movie)
-    (:Person)-[:DIRECTED]->(:Movie)
-    (:User)-[:RATED]->(:Movie)
-    (:Movie)-[:IN_GENRE]->(:Genre)
-    """
-    
-    # Cypher examples as input/query pairs
-    examples = [
-        "USER INPUT: 'Get user ratings for a movie?' QUERY: MATCH (u:User)-[r:RATED]->(m:Movie) WHERE m.title = 'Movie Title' RETURN r.rating"
-        "USER INPUT: 'Get details for this case sensitive name property' QUERY: MATCH (n) WHERE toLower(n.name) CONTAINS toLower(name) RETURN n"
-    ]
-
-    # Build the retriever
-    retriever = Text2CypherRetriever(
-        driver=driver,
-        neo4j_database=database,
-        llm=t2c_llm,
-        neo4j_schema=neo4j_schema,
-        examples=examples,
-    )
-
-    result = retriever.search(query_text=query)
+    # Building the retriever and searching both block, so they run in a
+    # thread to keep the event loop free
+    retriever = await asyncio.to_thread(get_t2c_retriever)
+    result = await asyncio.to_thread(retriever.search, query_text=query)
 
     results = {
         "cypher": result.metadata["cypher"],
@@ -295,4 +391,11 @@ async def catch_all_query_movie_database(query: str, ctx: Context) -> dict:
 
 
 if __name__ == "__main__":
+    # Use the faster uvloop event loop when it is installed
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
     mcp.run(transport="streamable-http")
@@ -0,0 +1,78 @@
+# This module provides a single Neo4j driver shared by the examples.
+#
+# The driver is created the first time `get_driver()` is called, reused by
+# every later call, and closed automatically when the program exits.
+#
+# The `.env` file is read once per process by `get_env()` and 
+# `get_driver_settings()`, the examples use them instead of calling 
+# `load_dotenv()` and `os.getenv()` themselves.
+
+import atexit
+import os
+from functools import lru_cache
+
+from dotenv import load_dotenv
+from neo4j import GraphDatabase
+
+_driver = None
+
+@lru_cache(maxsize=1)
+def _load_env():
+    # Load the .env file once per process
+    load_dotenv()
+
+@lru_cache(maxsize=1)
+def get_env():
+    # Read the connection details
+    _load_env()
+    return (
+        os.environ['NEO4J_URI'],
+        os.environ['NEO4J_USERNAME'],
+        os.environ['NEO4J_PASSWORD'],
+        os.getenv('NEO4J_DATABASE', 'neo4j')
+    )
+
+@lru_cache(maxsize=1)
+def get_driver_settings():
+    # Read the optional connection pool and transaction retry settings
+    _load_env()
+    return (
+        int(os.getenv('NEO4J_POOL_SIZE', '100')),
+        float(os.getenv('NEO4J_ACQ_TIMEOUT', '30')),
+        float(os.getenv('NEO4J_RETRY_MS', '5000'))
+    )
+
+def get_database():
+    # The database every example reads from and writes to
+    return get_env()[3]
+
+def driver_config():
+    # Keyword arguments shared by the sync and async drivers
+    pool_size, acquisition_timeout, retry_ms = get_driver_settings()
+    return {
+        # Size the connection pool and fail fast when no connection is free
+        'max_connection_pool_size': pool_size,
+        'connection_acquisition_timeout': acquisition_timeout,
+        'max_connection_lifetime': 30 * 60,
+        'keep_alive': True,
+        # Stop retrying failed transactions after NEO4J_RETRY_MS milliseconds
+        'max_transaction_retry_time': retry_ms / 1000
+    }
+
+def get_driver():
+    global _driver
+
+    if _driver is None:
+        uri, username, password, _ = get_env()
+
+        # Initialize the Neo4j driver
+        _driver = GraphDatabase.driver(
+            uri,
+            auth=(username, password),
+            **driver_config()
+        )
+
+        # Close the driver when the program exits
+        atexit.register(_driver.close)
+
+    return _driver
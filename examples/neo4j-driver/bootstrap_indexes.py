@@ -0,0 +1,35 @@
+# This example creates the constraints and indexes used by the other examples.
+#
+# Each uniqueness constraint is backed by an index, so queries that look up 
+# a `Person` by `id`, or a `Location` or `Company` by `name`, use an index 
+# seek instead of scanning every node with the label.
+#
+# `Person.name` is not unique, so it gets a plain index which is used when 
+# `transaction.py` merges people by name.
+#
+# The statements use `IF NOT EXISTS`, so it is safe to run them repeatedly.
+
+from _driver import get_driver, get_database
+
+CONSTRAINTS = [
+    "CREATE CONSTRAINT person_id IF NOT EXISTS FOR (p:Person) REQUIRE p.id IS UNIQUE",
+    "CREATE CONSTRAINT location_name IF NOT EXISTS FOR (l:Location) REQUIRE l.name IS UNIQUE",
+    "CREATE CONSTRAINT company_name IF NOT EXISTS FOR (c:Company) REQUIRE c.name IS UNIQUE",
+]
+
+INDEXES = [
+    "CREATE INDEX person_name IF NOT EXISTS FOR (p:Person) ON (p.name)",
+]
+
+def create_constraints(driver):
+    for constraint in CONSTRAINTS:
+        driver.execute_query(constraint, database_=get_database())
+
+def create_indexes(driver):
+    for index in INDEXES:
+        driver.execute_query(index, database_=get_database())
+
+if __name__ == '__main__':
+    driver = get_driver()
+    create_constraints(driver)
+    create_indexes(driver)
@@ -16,57 +16,54 @@
 # +-----------+
 
 import os
-from dotenv import load_dotenv
-load_dotenv()
-
 import csv
-from neo4j import GraphDatabase
+from _driver import get_driver, get_database
+from bootstrap_indexes import create_constraints
 
 FILE_PATH = os.path.join('data','employees.csv')
 
-# Initialize the Neo4j driver
-driver = GraphDatabase.driver(
-    os.getenv('NEO4J_URI'),
-    auth=(
-        os.getenv('NEO4J_USERNAME'), 
-        os.getenv('NEO4J_PASSWORD')
-    )
-)
+# CSV headers that are renamed to match the Cypher property names
+FIELD_NAMES = {'gov_id': 'governmentId'}
+
+# Number of rows sent to the database in each query
+BATCH_SIZE = 1000
+
+# Get the shared Neo4j driver
+driver = get_driver()
 
 # Verify the connection
 # driver.verify_connectivity()
 
+# Create constraints so MERGE can find existing nodes using an index
+# instead of scanning every node with the label
+create_constraints(driver)
+
 # Cypher query to create the data
+# UNWIND turns the list of rows into individual rows, so a whole batch
+# is created in a single query and transaction
 cypher_query = """
-MERGE (p:Person {id: toInteger($id), name: $name, governmentId: $gov_id})
-MERGE (l:Location {name: $location})
-MERGE (c:Company {name: $company})
+UNWIND $rows AS row
+MERGE (p:Person {id: toInteger(row.id), name: row.name, governmentId: row.governmentId})
+MERGE (l:Location {name: row.location})
+MERGE (c:Company {name: row.company})
 MERGE (p)-[:LIVES_IN]->(l)
-MERGE (p)-[:WORKS_AT {position: $position}]->(c)
+MERGE (p)-[:WORKS_AT {position: row.position}]->(c)
 """
 
 # Load the CSV file
 with open(FILE_PATH, newline='') as csvfile:
     reader = csv.DictReader(csvfile)
-    for row in reader:
-        
-        # Execute the query with parameters
-        records, summary, keys = driver.execute_query(
-            cypher_query,
-            id=row['id'],
-            name=row['name'],
-            gov_id=row['gov_id'],
-            location=row['location'],
-            company=row['company'],
-            position=row['position']
-        )
+    reader.fieldnames = [FIELD_NAMES.get(name, name) for name in reader.fieldnames]
 
-        # Alternatively, you can pass the row as parameters
-        # records, summary, keys = driver.execute_query(
-        #     cypher_query,
-        #     parameters_= row
-        # )
+    # Each row is passed to the query as is, with no repacking
+    rows = list(reader)
 
-        print(summary.counters)
+# Execute the query for each batch of rows
+for i in range(0, len(rows), BATCH_SIZE):
+    records, summary, keys = driver.execute_query(
+        cypher_query,
+        database_=get_database(),
+        rows=rows[i:i + BATCH_SIZE]
+    )
 
-driver.close()
\ No newline at end of file
+    print(summary.counters)
\ No newline at end of file
@@ -1,47 +1,59 @@
 # This example demonstrates how to run a Cypher query and export the results to a 
 # Pandas DataFrame.
+#
+# The results are fetched in chunks, and each chunk is converted to its own
+# DataFrame, so only one chunk is held in memory at a time.
 # 
 # You can add the expected data to the database using the `examples/create_data.py` 
 # example.
 
-import os
-from dotenv import load_dotenv
-load_dotenv()
+import pandas as pd
+from neo4j import READ_ACCESS
+from _driver import get_driver, get_database
 
-from neo4j import GraphDatabase, Result
+# Get the shared Neo4j driver
+driver = get_driver()
 
-# Initialize the Neo4j driver
-driver = GraphDatabase.driver(
-    os.getenv('NEO4J_URI'),
-    auth=(
-        os.getenv('NEO4J_USERNAME'), 
-        os.getenv('NEO4J_PASSWORD')
-    )
-)
+# Number of rows in each DataFrame chunk
+CHUNK_SIZE = 10_000
 
-# Verify the connection
-driver.verify_connectivity()
+# All of the returned columns are strings, storing them as pyarrow backed 
+# strings uses less memory than the default object dtype.
+# This requires the `pyarrow` package.
+DTYPES = {
+    'name': 'string[pyarrow]',
+    'company': 'string[pyarrow]',
+    'position': 'string[pyarrow]',
+    'location': 'string[pyarrow]'
+}
 
 # Define the query
-cypher_query = """
-MATCH (p:Person)-[:LIVES_IN]->(l:Location)
+# Only scalar properties are returned, not whole nodes, so the driver does
+# not have to build graph objects for each record. The location is filtered
+# in the node pattern and not bound to a variable, as only its name is needed.
+CYPHER_EXPORT_DF = """
+MATCH (p:Person)-[:LIVES_IN]->(:Location {name: $location})
 MATCH (p)-[w:WORKS_AT]->(c:Company)
 RETURN 
-    p.name as name, 
-    c.name as company, 
-    w.position as position, 
-    l.name as location
+    p.name AS name, 
+    c.name AS company, 
+    w.position AS position, 
+    $location AS location
 """
 
-# Execute the query using the Result transformer 
-df = driver.execute_query(
-    cypher_query,
-    result_transformer_=Result.to_df,
-    location='London'
-)
-
-# Print the DataFrame
-print(df)
-
-# Close the driver
-driver.close()
\ No newline at end of file
+# Run the query in a read session, fetch_size limits how many records the
+# server sends in each batch
+with driver.session(
+    database=get_database(),
+    default_access_mode=READ_ACCESS,
+    fetch_size=CHUNK_SIZE
+) as session:
+    result = session.run(CYPHER_EXPORT_DF, location='London')
+    keys = result.keys()
+
+    # Convert each chunk of records to a DataFrame
+    while records := result.fetch(CHUNK_SIZE):
+        df = pd.DataFrame(records, columns=keys).astype(DTYPES)
+
+        # Print the DataFrame
+        print(df)
\ No newline at end of file
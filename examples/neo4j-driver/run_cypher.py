@@ -4,51 +4,37 @@
 # You can add the expected data to the database using the `examples/create_data.py` 
 # example.
 
-import os
-from dotenv import load_dotenv
-load_dotenv()
+from _driver import get_driver, get_database
 
-from neo4j import GraphDatabase
-
-# Initialize the Neo4j driver
-driver = GraphDatabase.driver(
-    os.getenv('NEO4J_URI'),
-    auth=(
-        os.getenv('NEO4J_USERNAME'), 
-        os.getenv('NEO4J_PASSWORD')
-    )
-)
-
-# Verify the connection
-driver.verify_connectivity()
+# Get the shared Neo4j driver
+driver = get_driver()
 
 # Define the query
-cypher_query = """
-MATCH (p:Person)-[:LIVES_IN]->(l:Location)
+CYPHER_RUN = """
+MATCH (p:Person)-[:LIVES_IN]->(:Location {name: $location})
 MATCH (p)-[w:WORKS_AT]->(c:Company)
-WHERE l.name = $location
-RETURN p.name as name, c.name as company, w.position as position
+RETURN p.name AS name, c.name AS company, w.position AS position
 """
 
-# Execute the query with a parameter
-records, summary, keys = driver.execute_query(
-    cypher_query,
-    location='London'
-)
+# Format each record as a line of text while the result is consumed, 
+# instead of collecting the records into a list first
+def format_records(result):
+    return [
+        f"Name: {record['name']}, Company: {record['company']}, Position: {record['position']}"
+        for record in result
+    ]
 
+# Execute the query with a parameter
 # When only reading data, you can optimize performance by setting the 
 # routing_ parameter to READ mode.
+# Setting database_ saves the driver a round-trip to find the home database.
+lines = driver.execute_query(
+    CYPHER_RUN,
+    routing_='r',
+    database_=get_database(),
+    result_transformer_=format_records,
+    location='London'
+)
 
-# records, summary, keys = driver.execute_query(
-#     cypher_query,
-#     routing_='r',
-#     location='London'
-# )
-
-# Parse the result
-for record in records:
-    # Print the return values
-    print(f"Name: {record['name']}, Company: {record['company']}, Position: {record['position']}")
-
-# Close the driver
-driver.close()
\ No newline at end of file
+# Print the result
+print('\n'.join(lines))
\ No newline at end of file
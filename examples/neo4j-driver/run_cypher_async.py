@@ -0,0 +1,47 @@
+# This example demonstrates how to run a Cypher query using the async Neo4j 
+# Python driver.
+# 
+# The async driver lets an asyncio application run many queries at the same 
+# time without blocking the event loop.
+# 
+# You can add the expected data to the database using the `examples/create_data.py` 
+# example.
+
+import asyncio
+import sys
+
+from neo4j import AsyncGraphDatabase
+from _driver import get_env, driver_config
+
+# Define the query
+CYPHER_RUN = """
+MATCH (p:Person)-[:LIVES_IN]->(:Location {name: $location})
+MATCH (p)-[w:WORKS_AT]->(c:Company)
+RETURN p.name AS name, c.name AS company, w.position AS position
+"""
+
+async def main():
+    uri, username, password, database = get_env()
+
+    # Initialize the async Neo4j driver, it is closed when the block exits
+    async with AsyncGraphDatabase.driver(
+        uri,
+        auth=(username, password),
+        **driver_config()
+    ) as driver:
+
+        # Execute the query with a parameter
+        records, summary, keys = await driver.execute_query(
+            CYPHER_RUN,
+            routing_='r',
+            database_=database,
+            location='London'
+        )
+
+        # Print the return values with a single write
+        sys.stdout.write('\n'.join(
+            f"Name: {record['name']}, Company: {record['company']}, Position: {record['position']}"
+            for record in records
+        ) + '\n')
+
+asyncio.run(main())
@@ -1,20 +1,31 @@
 # This will test the environment to ensure that the .env file is set up 
 # correctly and that the Neo4j connection is working.
+#
+# The tests do not depend on each other, so they can be run in parallel 
+# with pytest-xdist:
+#
+#   python -m pytest -n auto test_environment.py
 import os
 import unittest
 
 from dotenv import load_dotenv
 load_dotenv()
 
+NEO4J_VARIABLES = ['NEO4J_URI', 'NEO4J_USERNAME', 'NEO4J_PASSWORD']
+
 class TestEnvironment(unittest.TestCase):
 
-    skip_env_variable_tests = True
-    skip_neo4j_test = True
+    # Work out which tests to skip up front, so the tests do not depend on 
+    # the order they are run in
+    @classmethod
+    def setUpClass(cls):
+        cls.skip_env_variable_tests = not os.path.exists('.env')
+        cls.skip_neo4j_test = cls.skip_env_variable_tests or not all(
+            os.getenv(variable_name) for variable_name in NEO4J_VARIABLES
+        )
 
     def test_env_file_exists(self):
         env_file_exists = os.path.exists('.env')
-        if env_file_exists:
-            TestEnvironment.skip_env_variable_tests = False
         self.assertTrue(env_file_exists, ".env file not found.")
 
     def env_variable_exists(self, variable_name):
@@ -23,46 +34,30 @@ class TestEnvironment(unittest.TestCase):
             f"{variable_name} not found in .env file")
 
     def test_neo4j_variables(self):
-        if TestEnvironment.skip_env_variable_tests:
+        if self.skip_env_variable_tests:
             self.skipTest("Skipping Neo4j env variables test")
 
-        self.env_variable_exists('NEO4J_URI')
-        self.env_variable_exists('NEO4J_USERNAME')
-        self.env_variable_exists('NEO4J_PASSWORD')
-        TestEnvironment.skip_neo4j_test = False
+        for variable_name in NEO4J_VARIABLES:
+            self.env_variable_exists(variable_name)
 
     def test_neo4j_connection(self):
-        if TestEnvironment.skip_neo4j_test:
+        if self.skip_neo4j_test:
             self.skipTest("Skipping Neo4j connection test")
 
-        from neo4j import GraphDatabase
+        from _driver import get_driver
 
-        driver = GraphDatabase.driver(
-            os.getenv('NEO4J_URI'),
-            auth=(os.getenv('NEO4J_USERNAME'), 
-                  os.getenv('NEO4J_PASSWORD'))
-        )
+        # Reuse the shared driver and its connection pool
+        driver = get_driver()
         try:
             driver.verify_connectivity()
             connected = True
         except Exception as e:
             connected = False
 
-        driver.close()
-
         self.assertTrue(
             connected,
             "Neo4j connection failed. Check the NEO4J_URI, NEO4J_USERNAME, and NEO4J_PASSWORD values in .env file."
             )
-        
-def suite():
-    suite = unittest.TestSuite()
-    suite.addTest(TestEnvironment('test_env_file_exists'))
-    suite.addTest(TestEnvironment('test_neo4j_variables'))
-    suite.addTest(TestEnvironment('test_neo4j_connection'))
-    return suite
 
 if __name__ == '__main__':
-    runner = unittest.TextTestRunner()
-    runner.run(suite())
-    
\ No newline at end of file
+    unittest.main()
@@ -1,37 +1,30 @@
-import os
-from dotenv import load_dotenv
-load_dotenv()
+from _driver import get_driver, get_database
 
-from neo4j import GraphDatabase
-
-# Initialize the Neo4j driver
-driver = GraphDatabase.driver(
-    os.getenv('NEO4J_URI'),
-    auth=(
-        os.getenv('NEO4J_USERNAME'), 
-        os.getenv('NEO4J_PASSWORD')
-    )
-)
-
-# Verify the connection
-driver.verify_connectivity()
+# Get the shared Neo4j driver
+driver = get_driver()
 
 # Create a session to run a transaction
-with driver.session() as session:
+with driver.session(database=get_database()) as session:
 
     # Create a work unit for the transaction
-    def create_person(tx, name, age):
+    # UNWIND creates every person in the list with a single query.
+    # MERGE makes the query idempotent, so it is safe to retry.
+    def create_persons(tx, rows):
         result = tx.run("""
-        CREATE (p:Person {name: $name, age: $age})
-        RETURN p
-        """, name=name, age=age)
+        UNWIND $rows AS r
+        MERGE (p:Person {name: r.name})
+        ON CREATE SET p.age = r.age
+        RETURN count(p) AS count
+        """, rows=rows)
 
-        return result.consume()
+        # The count is returned with the record, so there is no need to
+        # consume() the result to get the summary
+        return result.single()['count']
 
     # Execute transaction function
-    summary = session.execute_write(create_person, name='Alice', age=30)
-
-    print(summary.counters.nodes_created, 'node(s) created.')
+    count = session.execute_write(create_persons, rows=[
+        {'name': 'Alice', 'age': 30},
+        {'name': 'Bob', 'age': 25},
+    ])
 
-# Close the driver
-driver.close()
\ No newline at end of file
+    print(count, 'person(s) merged.')
\ No newline at end of file
@@ -0,0 +1,46 @@
+# This example demonstrates how to execute Cypher in a transaction using the 
+# async Neo4j Python driver.
+
+import asyncio
+
+from neo4j import AsyncGraphDatabase
+from _driver import get_env, driver_config
+
+# Create a work unit for the transaction
+# UNWIND creates every person in the list with a single query.
+# MERGE makes the query idempotent, so it is safe to retry.
+async def create_persons(tx, rows):
+    result = await tx.run("""
+    UNWIND $rows AS r
+    MERGE (p:Person {name: r.name})
+    ON CREATE SET p.age = r.age
+    RETURN count(p) AS count
+    """, rows=rows)
+
+    # The count is returned with the record, so there is no need to
+    # consume() the result to get the summary
+    record = await result.single()
+    return record['count']
+
+async def main():
+    uri, username, password, database = get_env()
+
+    # Initialize the async Neo4j driver, it is closed when the block exits
+    async with AsyncGraphDatabase.driver(
+        uri,
+        auth=(username, password),
+        **driver_config()
+    ) as driver:
+
+        # Create a session to run a transaction
+        async with driver.session(database=database) as session:
+
+            # Execute transaction function
+            count = await session.execute_write(create_persons, rows=[
+                {'name': 'Alice', 'age': 30},
+                {'name': 'Bob', 'age': 25},
+            ])
+
+            print(count, 'person(s) merged.')
+
+asyncio.run(main())